@@ -14,6 +14,7 @@ os.environ['RCLONE_REMOTE_NAME'] = 'test_remote'
 os.environ['RCLONE_BASE_PATH'] = 'Test/Path'
 os.environ['SLACK_WEBHOOK_URL'] = 'https://hooks.slack.com/test/webhook'
 os.environ['DEBUG'] = '1'
+os.environ['ZOOM_TOKEN_CACHE_FILE'] = ''
 
 
 @pytest.fixture
@@ -184,7 +184,7 @@ class TestMainWorkflow:
         # Mock RcloneClient
         mock_rclone = Mock()
         mock_rclone.upload_directory.return_value = 'Test/Path/2024-01-15'
-        mock_rclone.get_file_id.return_value = 'file_id_123'
+        mock_rclone.get_file_ids.return_value = {'test_recording.mp4': 'file_id_123'}
         mock_rclone_class.return_value = mock_rclone
 
         # Mock SlackClient
@@ -207,7 +207,99 @@ class TestMainWorkflow:
         mock_zoom.get_recordings.assert_called_once()
         mock_zoom.process_recording.assert_called_once()
         mock_rclone.upload_directory.assert_called_once()
-        mock_slack.send_notification.assert_called_once()
+        mock_rclone.get_file_ids.assert_called_once_with('2024-01-15')
+        mock_slack.queue_notification.assert_called_once_with(
+            recording_name='Weekly Sync Meeting',
+            file_name='test_recording.mp4',
+            file_id='file_id_123'
+        )
+        mock_slack.close.assert_called_once()
+        mock_zoom.close.assert_called_once()
+
+    @patch('zoom_manager.src.main.SlackClient')
+    @patch('zoom_manager.src.main.RcloneClient')
+    @patch('zoom_manager.src.main.ZoomClient')
+    def test_main_processes_multiple_recordings(self, mock_zoom_class, mock_rclone_class, mock_slack_class,
+                                                mock_zoom_user, mock_zoom_recording, tmp_path, caplog):
+        """Test every matching recording is processed and uploaded from its own folder."""
+        second_recording = {**mock_zoom_recording, 'uuid': 'recording456'}
+
+        def fake_process_recording(recording, meeting_name, failed_files=None):
+            if recording['uuid'] == 'recording456':
+                failed_files.append('recording.m4a')
+            folder = tmp_path / recording['uuid']
+            folder.mkdir()
+            file_path = folder / 'recording.mp4'
+            file_path.write_bytes(b'video')
+            return [{'name': 'recording.mp4', 'path': file_path, 'date_folder': '2024-01-15'}]
+
+        mock_zoom = Mock()
+        mock_zoom.get_user_by_email.return_value = mock_zoom_user
+        mock_zoom.get_recordings.return_value = {'meetings': [mock_zoom_recording, second_recording]}
+        mock_zoom.get_actual_duration.return_value = 45
+        mock_zoom.process_recording.side_effect = fake_process_recording
+        mock_zoom_class.return_value = mock_zoom
+
+        mock_rclone = Mock()
+        mock_rclone.upload_directory.return_value = 'Test/Path/2024-01-15'
+        mock_rclone.get_file_ids.return_value = {}
+        mock_rclone_class.return_value = mock_rclone
+
+        mock_slack_class.return_value = Mock()
+
+        test_args = ['main.py', '--name', 'Weekly', '--email', 'test@example.com']
+
+        # Keep pytest's log capture handler, which setup_logging would remove
+        with patch('sys.argv', test_args), patch('zoom_manager.src.main.setup_logging'):
+            main()
+
+        assert mock_zoom.process_recording.call_count == 2
+        uploaded_dirs = {call.args[0] for call in mock_rclone.upload_directory.call_args_list}
+        assert uploaded_dirs == {tmp_path / 'recording123', tmp_path / 'recording456'}
+        assert not (tmp_path / 'recording123').exists()
+        assert not (tmp_path / 'recording456').exists()
+        # The partially downloaded recording is reported rather than claimed complete
+        assert "Uploaded 1 of 2 files" in caplog.text
+        assert "failed to download: recording.m4a" in caplog.text
+
+    @patch('zoom_manager.src.main.SlackClient')
+    @patch('zoom_manager.src.main.RcloneClient')
+    @patch('zoom_manager.src.main.ZoomClient')
+    def test_main_stream_upload(self, mock_zoom_class, mock_rclone_class, mock_slack_class,
+                                mock_zoom_user, mock_zoom_recordings_response):
+        """Test --stream-upload pipes files through rclone instead of staging a directory."""
+        mock_zoom = Mock()
+        mock_zoom.get_user_by_email.return_value = mock_zoom_user
+        mock_zoom.get_recordings.return_value = mock_zoom_recordings_response
+        mock_zoom.get_actual_duration.return_value = 45
+        mock_zoom.stream_recording.return_value = [
+            {'name': 'recording.mp4', 'date_folder': '2024-01-15', 'recording_time': '2024-01-15T10:00:00Z'}
+        ]
+        mock_zoom_class.return_value = mock_zoom
+
+        mock_rclone = Mock()
+        mock_rclone.base_path = 'Test/Path'
+        mock_rclone.get_file_ids.return_value = {}
+        mock_rclone_class.return_value = mock_rclone
+
+        mock_slack = Mock()
+        mock_slack_class.return_value = mock_slack
+
+        test_args = ['main.py', '--name', 'Weekly', '--email', 'test@example.com', '--stream-upload']
+
+        with patch('sys.argv', test_args):
+            main()
+
+        mock_zoom.stream_recording.assert_called_once()
+        assert mock_zoom.stream_recording.call_args[0][2] == mock_rclone.upload_stream
+        assert mock_zoom.stream_recording.call_args[1]['exists'] == mock_rclone.has_file
+        mock_zoom.process_recording.assert_not_called()
+        mock_rclone.upload_directory.assert_not_called()
+        mock_slack.queue_notification.assert_called_once_with(
+            recording_name='Weekly Sync Meeting',
+            file_name='recording.mp4',
+            file_id='Test/Path/2024-01-15/recording.mp4'
+        )
 
     @patch('zoom_manager.src.main.SlackClient')
     @patch('zoom_manager.src.main.RcloneClient')
@@ -241,7 +333,7 @@ class TestMainWorkflow:
             main()
 
         # Slack notification should not be called
-        mock_slack.send_notification.assert_not_called()
+        mock_slack.queue_notification.assert_not_called()
 
     @patch('zoom_manager.src.main.SlackClient')
     @patch('zoom_manager.src.main.RcloneClient')
@@ -273,6 +365,33 @@ class TestMainWorkflow:
         # Should not proceed to get recordings
         mock_zoom.get_recordings.assert_not_called()
 
+    @patch('zoom_manager.src.main.SlackClient')
+    @patch('zoom_manager.src.main.RcloneClient')
+    @patch('zoom_manager.src.main.ZoomClient')
+    def test_main_closes_clients_on_error(self, mock_zoom_class, mock_rclone_class, mock_slack_class,
+                                          mock_zoom_user):
+        """Test queued notifications are flushed and sessions closed when the run fails."""
+        mock_zoom = Mock()
+        mock_zoom.get_user_by_email.return_value = mock_zoom_user
+        mock_zoom.get_recordings.side_effect = RuntimeError("API unavailable")
+        mock_zoom_class.return_value = mock_zoom
+
+        mock_slack = Mock()
+        mock_slack_class.return_value = mock_slack
+
+        test_args = [
+            'main.py',
+            '--name', 'Weekly',
+            '--email', 'test@example.com'
+        ]
+
+        with patch('sys.argv', test_args):
+            with pytest.raises(RuntimeError, match="API unavailable"):
+                main()
+
+        mock_slack.close.assert_called_once()
+        mock_zoom.close.assert_called_once()
+
     @patch('zoom_manager.src.main.SlackClient')
     @patch('zoom_manager.src.main.RcloneClient')
     @patch('zoom_manager.src.main.ZoomClient')
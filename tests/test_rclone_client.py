@@ -3,7 +3,7 @@ Unit tests for RcloneClient.
 """
 import pytest
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, MagicMock, patch
 import subprocess
 
 from zoom_manager.src.rclone_client import RcloneClient
@@ -29,6 +29,22 @@ class TestRcloneClient:
         assert client.rclone_executable == '/usr/bin/rclone'
         mock_which.assert_called_once_with('rclone')
 
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_is_remote_configured(self, mock_run, mock_which, mock_rclone_listremotes):
+        """Test remote lookups reuse the listremotes output from initialization."""
+        mock_which.return_value = '/usr/bin/rclone'
+        mock_result = Mock()
+        mock_result.stdout = mock_rclone_listremotes
+        mock_run.return_value = mock_result
+
+        client = RcloneClient()
+
+        assert client.is_remote_configured('drive')
+        assert client.is_remote_configured('backup:')
+        assert not client.is_remote_configured('missing')
+        mock_run.assert_called_once()
+
     @patch('zoom_manager.src.rclone_client.shutil.which')
     def test_init_rclone_not_installed(self, mock_which):
         """Test initialization when rclone is not installed."""
@@ -49,6 +65,19 @@ class TestRcloneClient:
         with pytest.raises(RuntimeError, match="remote 'test_remote' is not configured"):
             RcloneClient()
 
+    @patch('zoom_manager.src.rclone_client.RCLONE_REMOTE_NAME', None)
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_init_remote_name_unset(self, mock_run, mock_which, mock_rclone_listremotes):
+        """Test a missing remote name is reported as not configured."""
+        mock_which.return_value = '/usr/bin/rclone'
+        mock_result = Mock()
+        mock_result.stdout = mock_rclone_listremotes
+        mock_run.return_value = mock_result
+
+        with pytest.raises(RuntimeError, match="remote 'None' is not configured"):
+            RcloneClient()
+
     @patch('zoom_manager.src.rclone_client.shutil.which')
     @patch('zoom_manager.src.rclone_client.subprocess.run')
     def test_init_with_custom_parameters(self, mock_run, mock_which):
@@ -95,22 +124,102 @@ class TestRcloneClient:
         init_result = Mock()
         init_result.stdout = mock_rclone_listremotes
 
-        # Setup for mkdir
-        mkdir_result = Mock()
-        mkdir_result.returncode = 0
-
         # Setup for copy
         copy_result = Mock()
         copy_result.returncode = 0
 
-        mock_run.side_effect = [init_result, mkdir_result, copy_result]
+        mock_run.side_effect = [init_result, copy_result]
 
         client = RcloneClient()
         remote_path = client.upload_directory(temp_download_dir, '2024-01-15')
 
         assert remote_path == 'Test/Path/2024-01-15'
-        # Should call: listremotes (init), mkdir, copy
-        assert mock_run.call_count == 3
+        # Should call: listremotes (init), copy - rclone copy creates the folder itself
+        assert mock_run.call_count == 2
+        assert mock_run.call_args[0][0][1] == 'copy'
+
+    @patch('zoom_manager.config.settings.RCLONE_CHECKERS', 8)
+    @patch('zoom_manager.config.settings.RCLONE_TRANSFERS', 4)
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_directory_parallel_transfer_flags(self, mock_run, mock_which, mock_rclone_listremotes, temp_download_dir):
+        """Test directory upload passes parallel transfer tuning flags to rclone."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        mock_run.side_effect = [init_result, Mock()]
+
+        client = RcloneClient()
+        client.upload_directory(temp_download_dir, '2024-01-15')
+
+        copy_cmd = mock_run.call_args_list[-1][0][0]
+        assert copy_cmd[copy_cmd.index('--transfers') + 1] == '4'
+        assert copy_cmd[copy_cmd.index('--checkers') + 1] == '8'
+        assert '--drive-chunk-size' in copy_cmd
+        assert '--drive-upload-cutoff' not in copy_cmd
+        assert '--fast-list' in copy_cmd
+        assert '--checksum' in copy_cmd
+        assert copy_cmd[copy_cmd.index('--exclude') + 1] == '*.part'
+
+    @patch('zoom_manager.config.settings.RCLONE_DRIVE_UPLOAD_CUTOFF', '32M')
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_directory_explicit_upload_cutoff(self, mock_run, mock_which, mock_rclone_listremotes, temp_download_dir):
+        """Test the Drive upload cutoff is only passed when configured."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        mock_run.side_effect = [init_result, Mock()]
+
+        client = RcloneClient()
+        client.upload_directory(temp_download_dir, '2024-01-15')
+
+        copy_cmd = mock_run.call_args_list[-1][0][0]
+        assert copy_cmd[copy_cmd.index('--drive-upload-cutoff') + 1] == '32M'
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_directory_quiet_outside_debug(self, mock_run, mock_which, mock_rclone_listremotes, temp_download_dir):
+        """Test progress stats are disabled and stdout discarded when not debugging."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        mock_run.side_effect = [init_result, Mock()]
+
+        client = RcloneClient()
+        client.upload_directory(temp_download_dir, '2024-01-15')
+
+        copy_cmd = mock_run.call_args[0][0]
+        assert '--stats=0' in copy_cmd
+        assert '--progress' not in copy_cmd
+        assert '--verbose' not in copy_cmd
+        assert mock_run.call_args.kwargs['stdout'] == subprocess.DEVNULL
+
+    @patch('zoom_manager.config.settings.RCLONE_FAST_COMPARE', True)
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_directory_fast_compare(self, mock_run, mock_which, mock_rclone_listremotes, temp_download_dir):
+        """Test fast compare mode swaps checksum verification for size-only comparison."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        mock_run.side_effect = [init_result, Mock()]
+
+        client = RcloneClient()
+        client.upload_directory(temp_download_dir, '2024-01-15')
+
+        copy_cmd = mock_run.call_args_list[-1][0][0]
+        assert '--size-only' in copy_cmd
+        assert '--checksum' not in copy_cmd
 
     @patch('zoom_manager.src.rclone_client.shutil.which')
     @patch('zoom_manager.src.rclone_client.subprocess.run')
@@ -121,13 +230,9 @@ class TestRcloneClient:
         init_result = Mock()
         init_result.stdout = mock_rclone_listremotes
 
-        mkdir_result = Mock()
-        mkdir_result.returncode = 0
-
         # Simulate copy failure
         mock_run.side_effect = [
             init_result,
-            mkdir_result,
             subprocess.CalledProcessError(1, 'rclone copy')
         ]
 
@@ -136,6 +241,128 @@ class TestRcloneClient:
         with pytest.raises(subprocess.CalledProcessError):
             client.upload_directory(temp_download_dir, '2024-01-15')
 
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_file_success(self, mock_run, mock_which, mock_rclone_listremotes, sample_downloaded_file):
+        """Test single file upload copies into the date folder with transfer flags."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        mock_run.side_effect = [init_result, Mock()]
+
+        client = RcloneClient()
+        remote_path = client.upload_file(sample_downloaded_file)
+
+        assert remote_path == 'Test/Path/2024-01-15/test_recording.mp4'
+        copy_cmd = mock_run.call_args_list[-1][0][0]
+        assert copy_cmd[1:4] == ['copy', str(sample_downloaded_file['path']), 'test_remote:Test/Path/2024-01-15']
+        assert '--transfers' in copy_cmd
+        assert '--checkers' in copy_cmd
+        assert '--no-traverse' in copy_cmd
+        assert '--ignore-existing' in copy_cmd
+
+    @patch('zoom_manager.src.rclone_client.subprocess.Popen')
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_stream_success(self, mock_run, mock_which, mock_popen, mock_rclone_listremotes):
+        """Test streaming upload pipes every chunk into rclone rcat."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+        lsjson_result = Mock()
+        lsjson_result.stdout = '[]'
+        mock_run.side_effect = [init_result, lsjson_result]
+
+        process = Mock()
+        process.wait.return_value = 0
+        mock_popen.return_value = process
+
+        client = RcloneClient()
+        remote_path = client.upload_stream(
+            iter([b'chunk1', b'chunk2']),
+            {'name': 'test.mp4', 'date_folder': '2024-01-15'}
+        )
+
+        assert remote_path == 'Test/Path/2024-01-15/test.mp4'
+        rcat_cmd = mock_popen.call_args[0][0]
+        assert rcat_cmd[1:3] == ['rcat', 'test_remote:Test/Path/2024-01-15/test.mp4']
+        assert [c.args[0] for c in process.stdin.write.call_args_list] == [b'chunk1', b'chunk2']
+        process.stdin.close.assert_called_once()
+        process.kill.assert_not_called()
+
+    @patch('zoom_manager.src.rclone_client.subprocess.Popen')
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_stream_skips_existing_file(self, mock_run, mock_which, mock_popen, mock_rclone_listremotes, mock_rclone_lsjson_response):
+        """Test streaming upload does not create a second copy of a file already on the remote."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+        lsjson_result = Mock()
+        lsjson_result.stdout = json.dumps(mock_rclone_lsjson_response)
+        mock_run.side_effect = [init_result, lsjson_result]
+
+        chunks = MagicMock()
+
+        client = RcloneClient()
+        remote_path = client.upload_stream(chunks, {'name': 'test_file.mp4', 'date_folder': '2024-01-15'})
+
+        assert remote_path == 'Test/Path/2024-01-15/test_file.mp4'
+        mock_popen.assert_not_called()
+        chunks.__iter__.assert_not_called()
+
+    @patch('zoom_manager.src.rclone_client.subprocess.Popen')
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_stream_kills_rclone_on_source_error(self, mock_run, mock_which, mock_popen, mock_rclone_listremotes):
+        """Test a failing source stream kills rclone instead of committing a partial file."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+        mock_run.return_value = init_result
+
+        process = Mock()
+        mock_popen.return_value = process
+
+        def failing_chunks():
+            yield b'chunk1'
+            raise RuntimeError("Download incomplete")
+
+        client = RcloneClient()
+
+        with pytest.raises(RuntimeError, match="Download incomplete"):
+            client.upload_stream(failing_chunks(), {'name': 'test.mp4', 'date_folder': '2024-01-15'})
+
+        process.kill.assert_called_once()
+        process.stdin.close.assert_not_called()
+
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_upload_file_rejects_in_memory_data(self, mock_run, mock_which, mock_rclone_listremotes):
+        """Test upload_file refuses file dicts that carry bytes instead of a path."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+        mock_run.return_value = init_result
+
+        client = RcloneClient()
+
+        with pytest.raises(ValueError, match="local 'path'"):
+            client.upload_file({
+                'name': 'test.mp4',
+                'data': b'fake video content',
+                'date_folder': '2024-01-15',
+            })
+
+        # Only the listremotes check from init should have run
+        assert mock_run.call_count == 1
+
     @patch('zoom_manager.src.rclone_client.shutil.which')
     @patch('zoom_manager.src.rclone_client.subprocess.run')
     def test_check_file_exists_true(self, mock_run, mock_which, mock_rclone_listremotes):
@@ -194,6 +421,9 @@ class TestRcloneClient:
         file_id = client.get_file_id('2024-01-15', 'test_file.mp4')
 
         assert file_id == 'drive_file_id_12345'
+        lsjson_cmd = mock_run.call_args[0][0]
+        assert '--no-modtime' in lsjson_cmd
+        assert '--no-mimetype' in lsjson_cmd
 
     @patch('zoom_manager.src.rclone_client.shutil.which')
     @patch('zoom_manager.src.rclone_client.subprocess.run')
@@ -214,6 +444,110 @@ class TestRcloneClient:
         with pytest.raises(ValueError, match="No metadata found"):
             client.get_file_id('2024-01-15', 'nonexistent.mp4')
 
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_get_file_ids_listing_failure(self, mock_run, mock_which, mock_rclone_listremotes):
+        """Test rclone's byte stderr is decoded into the listing error."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        mock_run.side_effect = [
+            init_result,
+            subprocess.CalledProcessError(3, 'rclone', stderr=b'directory not found'),
+        ]
+
+        client = RcloneClient()
+        with pytest.raises(RuntimeError, match="directory not found"):
+            client.get_file_ids('2024-01-15')
+
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_listing_not_cached_across_concurrent_upload(self, mock_run, mock_which, mock_rclone_listremotes,
+                                                          mock_rclone_lsjson_response):
+        """Test a listing fetched while an upload to the folder finished is not cached."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        stale_result = Mock()
+        stale_result.stdout = b'[]'
+        fresh_result = Mock()
+        fresh_result.stdout = json.dumps(mock_rclone_lsjson_response).encode()
+
+        listings = []
+
+        def run(cmd, **kwargs):
+            if 'listremotes' in cmd:
+                return init_result
+            listings.append(cmd)
+            if len(listings) == 1:
+                # Another recording's upload to the same folder completes mid-listing
+                client._invalidate_listing('2024-01-15')
+                return stale_result
+            return fresh_result
+
+        mock_run.side_effect = run
+
+        client = RcloneClient()
+
+        assert client.get_file_ids('2024-01-15') == {}
+        assert client.get_file_ids('2024-01-15') == {'test_file.mp4': 'drive_file_id_12345'}
+        assert len(listings) == 2
+
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_get_file_ids_single_listing(self, mock_run, mock_which, mock_rclone_listremotes, mock_rclone_lsjson_response):
+        """Test file IDs for a whole date folder come from one lsjson call."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        second_file = {**mock_rclone_lsjson_response[0], 'Name': 'test_file.m4a', 'ID': 'drive_file_id_67890'}
+        lsjson_result = Mock()
+        lsjson_result.stdout = json.dumps(mock_rclone_lsjson_response + [second_file]).encode()
+
+        mock_run.side_effect = [init_result, lsjson_result]
+
+        client = RcloneClient()
+        file_ids = client.get_file_ids('2024-01-15')
+
+        assert file_ids == {
+            'test_file.mp4': 'drive_file_id_12345',
+            'test_file.m4a': 'drive_file_id_67890',
+        }
+        assert mock_run.call_count == 2
+        assert mock_run.call_args[0][0][-1] == 'test_remote:Test/Path/2024-01-15'
+
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_get_file_id_uses_cached_listing(self, mock_run, mock_which, mock_rclone_listremotes,
+                                             mock_rclone_lsjson_response, temp_download_dir):
+        """Test repeated file ID lookups reuse one listing until the folder is uploaded to."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        lsjson_result = Mock()
+        lsjson_result.stdout = json.dumps(mock_rclone_lsjson_response)
+
+        mock_run.side_effect = [init_result, lsjson_result, Mock(), lsjson_result]
+
+        client = RcloneClient()
+        assert client.get_file_id('2024-01-15', 'test_file.mp4') == 'drive_file_id_12345'
+        assert client.get_file_ids('2024-01-15') == {'test_file.mp4': 'drive_file_id_12345'}
+        # listremotes + a single lsjson
+        assert mock_run.call_count == 2
+
+        # Uploading to the folder invalidates the cached listing
+        client.upload_directory(temp_download_dir, '2024-01-15')
+        client.get_file_id('2024-01-15', 'test_file.mp4')
+        assert mock_run.call_count == 4
+
     @patch('zoom_manager.src.rclone_client.shutil.which')
     @patch('zoom_manager.src.rclone_client.subprocess.run')
     def test_test_connection_success(self, mock_run, mock_which, mock_rclone_listremotes):
@@ -272,3 +606,50 @@ class TestRcloneClient:
 
         assert 'type' in config
         assert config['type'] == 'drive'
+
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_get_remote_info_with_separators(self, mock_run, mock_which, mock_rclone_listremotes):
+        """Test remote info parsing ignores separator lines and keeps values containing '='."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        config_result = Mock()
+        config_result.stdout = (
+            "--------------------\n"
+            "[test_remote]\n"
+            "type = drive\n"
+            "token = {\"access_token\":\"abc=\",\"expiry\":\"100%\"}\n"
+            "--------------------\n"
+        )
+
+        mock_run.side_effect = [init_result, config_result]
+
+        client = RcloneClient()
+        config = client.get_remote_info()
+
+        assert config == {
+            'type': 'drive',
+            'token': '{"access_token":"abc=","expiry":"100%"}',
+        }
+
+    @patch('zoom_manager.src.rclone_client.shutil.which')
+    @patch('zoom_manager.src.rclone_client.subprocess.run')
+    def test_get_remote_info_duplicate_key(self, mock_run, mock_which, mock_rclone_listremotes):
+        """Test a key repeated in the remote section keeps the last value instead of failing."""
+        mock_which.return_value = '/usr/bin/rclone'
+
+        init_result = Mock()
+        init_result.stdout = mock_rclone_listremotes
+
+        config_result = Mock()
+        config_result.stdout = "[test_remote]\ntype = drive\nscope = drive.readonly\nscope = drive\n"
+
+        mock_run.side_effect = [init_result, config_result]
+
+        client = RcloneClient()
+        config = client.get_remote_info()
+
+        assert config == {'type': 'drive', 'scope': 'drive'}
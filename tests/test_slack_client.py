@@ -27,7 +27,7 @@ class TestSlackClient:
         # Should use the test webhook from conftest
         assert client.webhook_url == 'https://hooks.slack.com/test/webhook'
 
-    @patch('zoom_manager.src.slack_client.requests.post')
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
     def test_send_notification_success(self, mock_post, mock_slack_response):
         """Test successful notification sending."""
         mock_post.return_value = mock_slack_response
@@ -59,7 +59,7 @@ class TestSlackClient:
         assert 'recording.mp4' in blocks[0]['text']['text']
         assert 'file_123' in blocks[0]['text']['text']
 
-    @patch('zoom_manager.src.slack_client.requests.post')
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
     def test_send_notification_with_drive_link(self, mock_post, mock_slack_response):
         """Test notification includes proper Google Drive link."""
         mock_post.return_value = mock_slack_response
@@ -78,7 +78,7 @@ class TestSlackClient:
         # Verify Drive link is correctly formatted
         assert f'https://drive.google.com/file/d/{file_id}/view' in text_content
 
-    @patch('zoom_manager.src.slack_client.requests.post')
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
     def test_send_notification_request_failure_redacts_url(self, mock_post, caplog):
         """Test notification sending with request failure."""
         webhook_url = 'https://hooks.slack.com/services/secret/path'
@@ -99,6 +99,41 @@ class TestSlackClient:
         assert webhook_url not in caplog.text
         assert 'ConnectionError' in caplog.text
 
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
+    def test_send_notification_reuses_session(self, mock_post, mock_slack_response):
+        """Test notifications share one pooled HTTP session."""
+        mock_post.return_value = mock_slack_response
+
+        client = SlackClient()
+        session = client._session
+        for file_name in ('first.mp4', 'second.mp4'):
+            client.send_notification(
+                recording_name='Weekly Sync',
+                file_name=file_name,
+                file_id='file_123'
+            )
+
+        assert mock_post.call_count == 2
+        assert client._session is session
+        assert isinstance(session, requests.Session)
+
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
+    def test_queue_notification_sends_in_background(self, mock_post, mock_slack_response):
+        """Test queued notifications are delivered once the client is closed."""
+        mock_post.return_value = mock_slack_response
+
+        client = SlackClient()
+        future = client.queue_notification(
+            recording_name='Weekly Sync',
+            file_name='recording.mp4',
+            file_id='file_123'
+        )
+        client.close()
+
+        assert future.done()
+        mock_post.assert_called_once()
+        assert 'recording.mp4' in mock_post.call_args[1]['json']['blocks'][0]['text']['text']
+
     def test_send_notification_no_webhook(self):
         """Test notification sending when no webhook configured."""
         client = SlackClient(webhook_url="")
@@ -110,7 +145,7 @@ class TestSlackClient:
             file_id='123'
         )
 
-    @patch('zoom_manager.src.slack_client.requests.post')
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
     def test_send_notification_http_error(self, mock_post, caplog):
         """Test notification sending with HTTP error response."""
         mock_response = Mock()
@@ -135,7 +170,7 @@ class TestSlackClient:
         assert 'HTTP 400 - invalid_payload' in caplog.text
         assert 'hooks.slack.com' not in caplog.text
 
-    @patch('zoom_manager.src.slack_client.requests.post')
+    @patch('zoom_manager.src.slack_client.requests.Session.post')
     def test_notification_message_structure(self, mock_post, mock_slack_response):
         """Test the structure of the notification message."""
         mock_post.return_value = mock_slack_response
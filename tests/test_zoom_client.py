@@ -1,7 +1,12 @@
 """
 Unit tests for ZoomClient.
 """
+import json
+import threading
+from email.message import Message
+
 import pytest
+import requests
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
@@ -19,7 +24,7 @@ class TestZoomClient:
         assert client.token_expires_at is None
         assert client.logger is not None
 
-    @patch('zoom_manager.src.zoom_client.requests.post')
+    @patch('zoom_manager.src.zoom_client.requests.Session.post')
     def test_get_access_token_success(self, mock_post, mock_oauth_token_response):
         """Test successful OAuth token retrieval."""
         mock_response = Mock()
@@ -35,7 +40,7 @@ class TestZoomClient:
         mock_post.assert_called_once()
         assert mock_post.call_args.kwargs['timeout'] == (10, 60)
 
-    @patch('zoom_manager.src.zoom_client.requests.post')
+    @patch('zoom_manager.src.zoom_client.requests.Session.post')
     def test_get_access_token_cached(self, mock_post, mock_oauth_token_response):
         """Test that cached token is used when still valid."""
         mock_response = Mock()
@@ -52,7 +57,69 @@ class TestZoomClient:
         # Should only call the API once
         assert mock_post.call_count == 1
 
-    @patch('zoom_manager.src.zoom_client.requests.post')
+    @patch('zoom_manager.src.zoom_client.requests.Session.post')
+    def test_access_token_cached_across_clients(self, mock_post, mock_oauth_token_response, tmp_path):
+        """Test a token saved by one client is reused by the next without an OAuth request."""
+        mock_response = Mock()
+        mock_response.json.return_value = mock_oauth_token_response
+        mock_post.return_value = mock_response
+        cache_file = tmp_path / 'cache' / 'token.json'
+
+        with patch('zoom_manager.config.settings.ZOOM_TOKEN_CACHE_FILE', str(cache_file)):
+            ZoomClient()._get_access_token()
+            client = ZoomClient()
+
+        assert client.access_token == 'test_access_token_123'
+        assert client._get_headers()['Authorization'] == 'Bearer test_access_token_123'
+        assert client._get_headers() is client._get_headers()
+        mock_post.assert_called_once()
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    @patch('zoom_manager.src.zoom_client.requests.Session.post')
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_rejected_cached_token_refreshed(self, mock_get, mock_post, mock_oauth_token_response,
+                                             mock_zoom_user, tmp_path):
+        """Test a cached token Zoom rejects with 401 is dropped and the call retried once."""
+        cache_file = tmp_path / 'token.json'
+        cache_file.write_text(json.dumps({
+            'key': 'test_account_id:test_client_id',
+            'access_token': 'revoked_token',
+            'expires_at': (datetime.now() + timedelta(hours=1)).timestamp(),
+        }))
+
+        rejected = Mock(status_code=401)
+        accepted = Mock(status_code=200)
+        accepted.json.return_value = mock_zoom_user
+        mock_get.side_effect = [rejected, accepted]
+        mock_post.return_value.json.return_value = mock_oauth_token_response
+
+        with patch('zoom_manager.config.settings.ZOOM_TOKEN_CACHE_FILE', str(cache_file)):
+            client = ZoomClient()
+            assert client.access_token == 'revoked_token'
+
+            user_info = client.get_user_by_email('test@example.com')
+
+        assert user_info == mock_zoom_user
+        mock_post.assert_called_once()
+        assert mock_get.call_args_list[0].kwargs['headers']['Authorization'] == 'Bearer revoked_token'
+        assert mock_get.call_args_list[1].kwargs['headers']['Authorization'] == 'Bearer test_access_token_123'
+        assert json.loads(cache_file.read_text())['access_token'] == 'test_access_token_123'
+
+    def test_cached_token_for_other_account_ignored(self, tmp_path):
+        """Test a cached token is only used by the Zoom app that obtained it."""
+        cache_file = tmp_path / 'token.json'
+        cache_file.write_text(json.dumps({
+            'key': 'other_account:other_client',
+            'access_token': 'foreign_token',
+            'expires_at': (datetime.now() + timedelta(hours=1)).timestamp(),
+        }))
+
+        with patch('zoom_manager.config.settings.ZOOM_TOKEN_CACHE_FILE', str(cache_file)):
+            client = ZoomClient()
+
+        assert client.access_token is None
+
+    @patch('zoom_manager.src.zoom_client.requests.Session.post')
     def test_get_access_token_failure(self, mock_post):
         """Test OAuth token retrieval failure."""
         mock_post.side_effect = Exception("API Error")
@@ -84,7 +151,39 @@ class TestZoomClient:
         # January is summer in Melbourne (UTC+11)
         assert mel_time.hour == 11
 
-    @patch('zoom_manager.src.zoom_client.requests.get')
+    @patch('zoom_manager.config.settings.MAX_CONCURRENT_RECORDINGS', 2)
+    @patch('zoom_manager.config.settings.MAX_CONCURRENT_DOWNLOADS', 4)
+    @patch('zoom_manager.config.settings.DOWNLOAD_CONNECTIONS', 4)
+    def test_session_pool_sized_for_concurrent_downloads(self):
+        """Test the pooled session keeps a connection per concurrent download request."""
+        client = ZoomClient()
+
+        adapter = client._session.get_adapter('https://api.zoom.us')
+        assert isinstance(client._session, requests.Session)
+        assert adapter._pool_maxsize == 32
+
+    def test_session_stores_no_cookies(self):
+        """Test the session shared across download threads keeps no per-response state."""
+        client = ZoomClient()
+        headers = Message()
+        headers['Set-Cookie'] = 'cdn_session=abc; Path=/'
+        raw_response = Mock()
+        raw_response._original_response = Mock(msg=headers)
+        request = requests.Request('GET', 'https://zoom.us/rec/download/test').prepare()
+
+        requests.cookies.extract_cookies_to_jar(client._session.cookies, request, raw_response)
+
+        assert len(client._session.cookies) == 0
+
+    @patch('zoom_manager.src.zoom_client.requests.Session.close')
+    def test_close_releases_session(self, mock_close):
+        """Test closing the client closes its pooled session."""
+        client = ZoomClient()
+        client.close()
+
+        mock_close.assert_called_once()
+
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
     def test_get_user_by_email_success(self, mock_get, mock_zoom_user):
         """Test successful user lookup by email."""
         mock_response = Mock()
@@ -102,7 +201,7 @@ class TestZoomClient:
         assert user_info['email'] == 'test@example.com'
         assert mock_get.call_args.kwargs['timeout'] == (10, 60)
 
-    @patch('zoom_manager.src.zoom_client.requests.get')
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
     def test_get_user_by_email_not_found(self, mock_get):
         """Test user lookup when user not found."""
         mock_response = Mock()
@@ -116,7 +215,7 @@ class TestZoomClient:
         with pytest.raises(ValueError, match="not found"):
             client.get_user_by_email('nonexistent@example.com')
 
-    @patch('zoom_manager.src.zoom_client.requests.get')
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
     def test_get_recordings_success(self, mock_get, mock_zoom_recordings_response):
         """Test successful recordings retrieval."""
         mock_response = Mock()
@@ -137,7 +236,7 @@ class TestZoomClient:
         assert mock_get.call_args.kwargs['params']['page_size'] == 300
         assert mock_get.call_args.kwargs['timeout'] == (10, 60)
 
-    @patch('zoom_manager.src.zoom_client.requests.get')
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
     def test_get_recordings_paginates(self, mock_get, mock_zoom_recording):
         """Test recordings retrieval follows Zoom next_page_token pagination."""
         first_response = Mock()
@@ -183,7 +282,7 @@ class TestZoomClient:
 
         assert duration == 30
 
-    @patch('zoom_manager.src.zoom_client.requests.get')
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
     def test_process_recording_debug_mode(self, mock_get, mock_zoom_recording):
         """Test process_recording in debug mode (no actual download)."""
         import zoom_manager.config.settings as settings
@@ -204,6 +303,161 @@ class TestZoomClient:
         finally:
             settings.DEBUG = original_debug
 
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    def test_process_recording_stages_files_per_recording(self, mock_zoom_recording, tmp_path):
+        """Test downloads are staged in a folder unique to the recording."""
+        def fake_download(download_url, output_path):
+            output_path.write_bytes(b'content')
+            return len(b'content')
+
+        client = ZoomClient()
+
+        with patch('zoom_manager.src.zoom_client.DOWNLOAD_DIR', tmp_path), \
+                patch.object(client, 'download_recording', side_effect=fake_download):
+            downloaded_files = client.process_recording(mock_zoom_recording, 'Weekly Sync')
+
+        assert len(downloaded_files) == 2
+        staging_dir = tmp_path / '2024-01-15_recording123'
+        assert {f['path'].parent for f in downloaded_files} == {staging_dir}
+        assert {f['date_folder'] for f in downloaded_files} == {'2024-01-15'}
+        assert all(f['file_size'] == len(b'content') for f in downloaded_files)
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.config.settings.MAX_CONCURRENT_DOWNLOADS', 2)
+    def test_process_recording_downloads_files_concurrently(self, mock_zoom_recording, tmp_path):
+        """Test a recording's files are downloaded at the same time, in plan order."""
+        # Each download waits for the other, so this only completes if they overlap
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_download(download_url, output_path):
+            barrier.wait()
+            output_path.write_bytes(b'content')
+            return len(b'content')
+
+        client = ZoomClient()
+
+        with patch('zoom_manager.src.zoom_client.DOWNLOAD_DIR', tmp_path), \
+                patch.object(client, 'download_recording', side_effect=fake_download):
+            downloaded_files = client.process_recording(mock_zoom_recording, 'Weekly Sync')
+
+        planned = client._plan_recording_files(mock_zoom_recording, 'Weekly Sync')
+        assert [f['name'] for f in downloaded_files] == [p['name'] for p in planned]
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    def test_process_recording_unique_names_for_shared_extension(self, mock_zoom_recording, tmp_path):
+        """Test file types sharing an extension are downloaded to distinct, complete files."""
+        recording = {**mock_zoom_recording, 'recording_files': [
+            {
+                'recording_type': 'shared_screen_with_speaker_view',
+                'download_url': 'https://zoom.us/rec/download/plain',
+                'status': 'completed',
+            },
+            {
+                'recording_type': 'shared_screen_with_speaker_view(cc)',
+                'download_url': 'https://zoom.us/rec/download/captioned',
+                'status': 'completed',
+            },
+        ]}
+
+        def fake_download(download_url, output_path):
+            content = download_url.encode() * 10
+            output_path.write_bytes(content)
+            return len(content)
+
+        client = ZoomClient()
+
+        with patch('zoom_manager.src.zoom_client.DOWNLOAD_DIR', tmp_path), \
+                patch.object(client, 'download_recording', side_effect=fake_download):
+            downloaded_files = client.process_recording(recording, 'Weekly Sync')
+
+        assert len({f['path'] for f in downloaded_files}) == 2
+        for file in downloaded_files:
+            assert file['path'].stat().st_size == file['file_size']
+        contents = {f['path'].read_bytes() for f in downloaded_files}
+        assert contents == {b'https://zoom.us/rec/download/plain' * 10,
+                            b'https://zoom.us/rec/download/captioned' * 10}
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    def test_process_recording_isolates_failed_file(self, mock_zoom_recording, tmp_path):
+        """Test one failed file doesn't discard the recording's other downloads."""
+        def fake_download(download_url, output_path):
+            if output_path.suffix == '.m4a':
+                raise RuntimeError("Download incomplete")
+            output_path.write_bytes(b'content')
+            return len(b'content')
+
+        client = ZoomClient()
+
+        with patch('zoom_manager.src.zoom_client.DOWNLOAD_DIR', tmp_path), \
+                patch.object(client, 'download_recording', side_effect=fake_download):
+            failed_files = []
+            downloaded_files = client.process_recording(mock_zoom_recording, 'Weekly Sync',
+                                                        failed_files=failed_files)
+
+        assert [f['path'].suffix for f in downloaded_files] == ['.mp4']
+        assert [name[-4:] for name in failed_files] == ['.m4a']
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_stream_recording(self, mock_get, mock_zoom_recording):
+        """Test streaming hands each file's chunks to the uploader without touching disk."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {'content-length': '12'}
+        mock_response.iter_content.return_value = [b'chunk1', b'chunk2']
+        mock_get.return_value = mock_response
+
+        uploaded = []
+
+        def upload(chunks, file_dict):
+            uploaded.append((file_dict['name'], b''.join(chunks)))
+
+        client = ZoomClient()
+        client.access_token = 'test_token'
+        client.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        streamed_files = client.stream_recording(mock_zoom_recording, 'Weekly Sync', upload)
+
+        assert [f['name'] for f in streamed_files] == [name for name, _ in uploaded]
+        assert all(data == b'chunk1chunk2' for _, data in uploaded)
+        assert {f['date_folder'] for f in streamed_files} == {'2024-01-15'}
+        assert all('path' not in f for f in streamed_files)
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_stream_recording_skips_existing(self, mock_get, mock_zoom_recording):
+        """Test files already on the remote are neither downloaded nor uploaded again."""
+        upload = Mock()
+
+        client = ZoomClient()
+        client.access_token = 'test_token'
+        client.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        streamed_files = client.stream_recording(
+            mock_zoom_recording, 'Weekly Sync', upload, exists=lambda name, date_folder: True
+        )
+
+        assert len(streamed_files) == len(mock_zoom_recording['recording_files'])
+        mock_get.assert_not_called()
+        upload.assert_not_called()
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_stream_recording_incomplete(self, mock_get, mock_zoom_recording):
+        """Test a truncated stream raises before the uploader sees end of file."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.headers = {'content-length': '100'}
+        mock_response.iter_content.return_value = [b'chunk1']
+        mock_get.return_value = mock_response
+
+        client = ZoomClient()
+        client.access_token = 'test_token'
+        client.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        with pytest.raises(RuntimeError, match="Download incomplete"):
+            client.stream_recording(mock_zoom_recording, 'Weekly Sync', lambda chunks, f: list(chunks))
+
     def test_file_type_extension_mapping(self):
         """Test file type to extension mapping."""
         client = ZoomClient()
@@ -224,7 +478,7 @@ class TestZoomClient:
         assert '..' not in sanitized
 
     @patch('zoom_manager.config.settings.DEBUG', False)
-    @patch('zoom_manager.src.zoom_client.requests.get')
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
     @patch('zoom_manager.src.zoom_client.tqdm')
     def test_download_recording_file(self, mock_tqdm, mock_get, temp_download_dir):
         """Test individual file download with progress."""
@@ -250,6 +504,99 @@ class TestZoomClient:
 
         result = client.download_recording(download_url, file_path)
 
-        assert result is True
+        assert result == 12
+        assert mock_tqdm.call_args.kwargs['mininterval'] == 0.25
         mock_get.assert_called_once()
         assert mock_get.call_args.kwargs['timeout'] == (10, 300)
+        mock_response.iter_content.assert_called_once_with(8 * 1024 * 1024)
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_download_recording_incomplete_removes_partial(self, mock_get, temp_download_dir):
+        """Test a truncated download raises and leaves neither the file nor its .part file."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'content-length': '100'}
+        mock_response.iter_content.return_value = [b'chunk1']
+        mock_get.return_value = mock_response
+
+        client = ZoomClient()
+        client.access_token = 'test_token'
+        client.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        file_path = temp_download_dir / 'truncated.mp4'
+        with pytest.raises(RuntimeError, match="Download incomplete"):
+            client.download_recording('https://zoom.us/rec/download/test', file_path)
+
+        assert not file_path.exists()
+        assert not list(temp_download_dir.glob('truncated.mp4.*'))
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.config.settings.DOWNLOAD_CONNECTIONS', 3)
+    @patch('zoom_manager.src.zoom_client.RANGED_DOWNLOAD_MIN_SIZE', 1)
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_download_recording_parallel_ranges(self, mock_get, temp_download_dir):
+        """Test large files are fetched as parallel byte ranges and reassembled in order."""
+        content = bytes(range(256)) * 40
+
+        def fake_get(url, headers=None, **kwargs):
+            response = MagicMock()
+            response.__enter__.return_value = response
+            byte_range = headers.get('Range')
+            if byte_range is None:
+                response.status_code = 200
+                response.headers = {'content-length': str(len(content)), 'accept-ranges': 'bytes'}
+            else:
+                start, end = (int(v) for v in byte_range[len('bytes='):].split('-'))
+                response.status_code = 206
+                part = content[start:end + 1]
+                response.iter_content.return_value = [part[:100], part[100:]]
+            return response
+
+        mock_get.side_effect = fake_get
+
+        client = ZoomClient()
+        client.access_token = 'test_token'
+        client.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        file_path = temp_download_dir / 'large.mp4'
+        result = client.download_recording('https://zoom.us/rec/download/large', file_path)
+
+        assert result == len(content)
+        assert file_path.read_bytes() == content
+        assert list(temp_download_dir.iterdir()) == [file_path]
+        # One probe request plus one request per range
+        assert mock_get.call_count == 4
+        ranges = sorted(call.kwargs['headers']['Range'] for call in mock_get.call_args_list[1:])
+        assert ranges == ['bytes=0-3413', 'bytes=3414-6827', 'bytes=6828-10239']
+        assert all(
+            call.kwargs['headers']['Authorization'] == 'Bearer test_token'
+            for call in mock_get.call_args_list
+        )
+
+    @patch('zoom_manager.config.settings.DEBUG', False)
+    @patch('zoom_manager.config.settings.DOWNLOAD_CONNECTIONS', 2)
+    @patch('zoom_manager.src.zoom_client.RANGED_DOWNLOAD_MIN_SIZE', 1)
+    @patch('zoom_manager.src.zoom_client.requests.Session.get')
+    def test_download_recording_range_ignored(self, mock_get, temp_download_dir):
+        """Test a server that ignores Range headers falls back to a single-stream download."""
+        content = b'x' * 1000
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 200
+        response.headers = {'content-length': str(len(content)), 'accept-ranges': 'bytes'}
+        response.iter_content.return_value = [content[:600], content[600:]]
+        mock_get.return_value = response
+
+        client = ZoomClient()
+        client.access_token = 'test_token'
+        client.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        file_path = temp_download_dir / 'large.mp4'
+        result = client.download_recording('https://zoom.us/rec/download/large', file_path)
+
+        assert result == len(content)
+        assert file_path.read_bytes() == content
+        assert not list(temp_download_dir.glob('*.part'))
+        # The retry is a plain request without a Range header
+        assert 'Range' not in mock_get.call_args.kwargs['headers']
@@ -25,10 +25,28 @@ ZOOM_CLIENT_ID = os.getenv("ZOOM_CLIENT_ID")
 ZOOM_CLIENT_SECRET = os.getenv("ZOOM_CLIENT_SECRET")
 ZOOM_ACCOUNT_ID = os.getenv("ZOOM_ACCOUNT_ID")
 ZOOM_API_BASE_URL = "https://api.zoom.us/v2"
+# Access tokens are reused across runs from this file; set empty to disable
+ZOOM_TOKEN_CACHE_FILE = os.path.expanduser(os.getenv("ZOOM_TOKEN_CACHE_FILE", "~/.cache/zoom_manager/token.json"))
 
 # Rclone Configuration (replaces Google Drive API)
 RCLONE_REMOTE_NAME = os.getenv("RCLONE_REMOTE_NAME")
 RCLONE_BASE_PATH = os.getenv("RCLONE_BASE_PATH")
+RCLONE_TRANSFERS = int(os.getenv("RCLONE_TRANSFERS", "8"))
+RCLONE_CHECKERS = int(os.getenv("RCLONE_CHECKERS", str(RCLONE_TRANSFERS * 2)))
+# Compare by size only instead of hashing every local file before upload
+RCLONE_FAST_COMPARE = os.getenv('RCLONE_FAST_COMPARE', 'false').lower() in ('true', '1', 't')
+# Drive upload chunk size; each parallel transfer buffers one chunk in memory
+RCLONE_DRIVE_CHUNK_SIZE = os.getenv("RCLONE_DRIVE_CHUNK_SIZE", "64M")
+# Size above which Drive uploads switch to chunked uploads (rclone's default when unset)
+RCLONE_DRIVE_UPLOAD_CUTOFF = os.getenv("RCLONE_DRIVE_UPLOAD_CUTOFF")
+
+# Parallel HTTP range connections used for large recording downloads
+DOWNLOAD_CONNECTIONS = int(os.getenv("DOWNLOAD_CONNECTIONS", "4"))
+# Files of a single recording downloaded in parallel
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv("MAX_CONCURRENT_DOWNLOADS", "4"))
+
+# Number of recordings processed in parallel
+MAX_CONCURRENT_RECORDINGS = int(os.getenv("MAX_CONCURRENT_RECORDINGS", "2"))
 
 # Slack Configuration
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
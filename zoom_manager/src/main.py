@@ -4,8 +4,8 @@ Handles command line interface, orchestrates the downloading of Zoom recordings,
 uploading to Google Drive, and sending Slack notifications.
 """
 
-import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,7 +15,7 @@ from zoom_manager.config.settings import (
     LOG_LEVEL,
     FILE_FORMATTER,
     CONSOLE_FORMATTER,
-    DOWNLOAD_DIR,
+    MAX_CONCURRENT_RECORDINGS,
 )
 from zoom_manager.src.zoom_client import ZoomClient
 from zoom_manager.src.rclone_client import RcloneClient
@@ -81,6 +81,8 @@ def parse_args():
     Returns:
         argparse.Namespace: Parsed command line arguments
     """
+    import argparse
+
     parser = argparse.ArgumentParser(description='Zoom Recording Manager')
     parser.add_argument(
         '--name',
@@ -118,10 +120,109 @@ def parse_args():
         type=str,
         help="Override rclone base path (defaults to RCLONE_BASE_PATH from .env)"
     )
+    parser.add_argument(
+        '--stream-upload',
+        action='store_true',
+        help="Stream recordings straight from Zoom to the rclone remote instead of downloading them first"
+    )
     
     args = parser.parse_args()
     return args
 
+def process_recording(zoom, rclone, slack, recording, target_recording_name, no_slack,
+                      stream_upload=False):
+    """
+    Download, upload, notify and clean up a single recording.
+    Errors are logged rather than raised so one failed recording doesn't stop the others.
+
+    Args:
+        zoom (ZoomClient): Zoom API client
+        rclone (RcloneClient): rclone upload client
+        slack (SlackClient): Slack notification client
+        recording (dict): Recording metadata from Zoom API
+        target_recording_name (str): Meeting name used for file naming
+        no_slack (bool): Skip Slack notifications when True
+        stream_upload (bool): Pipe files from Zoom straight to rclone without a local copy
+    """
+    logger = logging.getLogger(__name__)
+    topic = recording['topic']
+    logger.info(f"Processing recording: {topic}")
+    
+    # Check recording duration using API start_time and recording end timestamps
+    meta_duration = recording.get('duration', 0)
+    actual_duration = zoom.get_actual_duration(recording)
+    duration = max(meta_duration, actual_duration)
+    logger.debug(
+        "Recording '%s' durations – metadata: %smin, actual: %.1fmin",
+        topic, meta_duration, actual_duration
+    )
+    if duration < 5:
+        logger.info(
+            f"Skipping recording '{topic}' – duration ({duration:.1f} minutes) is below threshold"
+        )
+        return
+    
+    try:
+        local_dir = None
+        failed_files = []
+        if stream_upload:
+            # Pipe each file from Zoom into rclone; nothing is staged on disk
+            downloaded_files = zoom.stream_recording(
+                recording, target_recording_name, rclone.upload_stream, exists=rclone.has_file
+            )
+        else:
+            # Download files
+            downloaded_files = zoom.process_recording(
+                recording, target_recording_name, failed_files=failed_files
+            )
+        
+        if not downloaded_files:
+            logger.warning(f"No files were downloaded for recording: {topic}")
+            return
+
+        date_folder = downloaded_files[0]['date_folder']
+        if stream_upload:
+            remote_dir = f"{rclone.base_path}/{date_folder}"
+        else:
+            # Batch upload entire directory via rclone
+            local_dir = downloaded_files[0]['path'].parent
+            remote_dir = rclone.upload_directory(local_dir, date_folder)
+        if failed_files:
+            logger.warning(
+                f"Uploaded {len(downloaded_files)} of {len(downloaded_files) + len(failed_files)} files "
+                f"for {topic} to {remote_dir}; failed to download: {', '.join(failed_files)}"
+            )
+        else:
+            logger.info(f"Successfully uploaded all files to {remote_dir}")
+
+        # Send Slack notifications for .mp4 recordings (unless disabled)
+        if not no_slack:
+            mp4_names = [f['name'] for f in downloaded_files if f['name'].endswith('.mp4')]
+            drive_file_ids = {}
+            if mp4_names:
+                # One listing of the date folder resolves every file ID
+                try:
+                    drive_file_ids = rclone.get_file_ids(date_folder)
+                except Exception as e:
+                    logger.error(f"Failed to retrieve Drive file IDs for {date_folder}: {e}")
+
+            for name in mp4_names:
+                slack.queue_notification(
+                    recording_name=topic,
+                    file_name=name,
+                    file_id=drive_file_ids.get(name) or f"{remote_dir}/{name}"
+                )
+        else:
+            logger.info("Slack notifications disabled via --no-slack flag")
+
+        # Clean up downloaded files after successful upload
+        if local_dir:
+            cleanup_downloads(local_dir)
+            logger.info(f"Cleaned up downloaded files for {topic}")
+
+    except Exception as proc_error:
+        logger.error(f"Error processing recording {topic}: {str(proc_error)}")
+
 def main():
     """
     Main execution flow:
@@ -143,6 +244,7 @@ def main():
     days_to_search = args.days
     no_slack = args.no_slack
     slack_webhook = args.slack_webhook
+    stream_upload = args.stream_upload
 
     logger.info(f"Starting Zoom recording manager (searching last {days_to_search} days)")
     if slack_webhook:
@@ -151,7 +253,11 @@ def main():
         logger.info(f"Using custom rclone remote: {args.rclone_remote}")
     if args.rclone_base_path:
         logger.info(f"Using custom rclone base path: {args.rclone_base_path}")
+    if stream_upload:
+        logger.info("Streaming uploads enabled: recordings will not be saved locally")
 
+    zoom = None
+    slack = None
     try:
         # Initialize clients
         zoom = ZoomClient()
@@ -178,82 +284,42 @@ def main():
         recordings = zoom.get_recordings(user_id, start_date, end_date)
         
         # Filter recordings by name
+        target_name_lower = target_recording_name.lower()
         target_recordings = [
             rec for rec in recordings.get('meetings', [])
-            if target_recording_name.lower() in rec.get('topic', '').lower()
+            if target_name_lower in rec.get('topic', '').lower()
         ]
 
         if not target_recordings:
             logger.info(f"No recordings found matching '{target_recording_name}' in the last {days_to_search} days")
             return
 
-        # Process each recording
-        for recording in target_recordings:
-            logger.info(f"Processing recording: {recording['topic']}")
-            
-            # Check recording duration using API start_time and recording end timestamps
-            meta_duration = recording.get('duration', 0)
-            actual_duration = zoom.get_actual_duration(recording)
-            duration = max(meta_duration, actual_duration)
-            logger.debug(
-                f"Recording '{recording['topic']}' durations – metadata: {meta_duration}min, actual: {actual_duration:.1f}min"
-            )
-            if duration < 5:
-                logger.info(
-                    f"Skipping recording '{recording['topic']}' – duration ({duration:.1f} minutes) is below threshold"
+        # Process matching recordings, several at a time so that one meeting's
+        # download overlaps with another's upload
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RECORDINGS) as executor:
+            futures = [
+                executor.submit(
+                    process_recording,
+                    zoom, rclone, slack, recording, target_recording_name, no_slack,
+                    stream_upload
                 )
-                continue
-            
-            try:
-                # Download files
-                downloaded_files = zoom.process_recording(recording, target_recording_name)
-                
-                if not downloaded_files:
-                    logger.warning(f"No files were downloaded for recording: {recording['topic']}")
-                    continue
-
-                # Batch upload entire directory via rclone
-                local_dir = downloaded_files[0]['path'].parent
-                date_folder = downloaded_files[0]['date_folder']
-                remote_dir = rclone.upload_directory(local_dir, date_folder)
-                logger.info(f"Successfully uploaded all files to {remote_dir}")
-
-                # Send Slack notifications for .mp4 recordings (unless disabled)
-                if not no_slack:
-                    for file_dict in downloaded_files:
-                        if file_dict['name'].endswith('.mp4'):
-                            try:
-                                drive_file_id = rclone.get_file_id(
-                                    file_dict['date_folder'], file_dict['name']
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to retrieve Drive file ID for {file_dict['name']}: {e}"
-                                )
-                                drive_file_id = None
-
-                            slack.send_notification(
-                                recording_name=recording['topic'],
-                                file_name=file_dict['name'],
-                                file_id=drive_file_id or f"{remote_dir}/{file_dict['name']}"
-                            )
-                else:
-                    logger.info("Slack notifications disabled via --no-slack flag")
-
-                # Clean up downloaded files after successful upload
-                if downloaded_files:
-                    cleanup_downloads(downloaded_files[0]['path'].parent)
-                    logger.info(f"Cleaned up downloaded files for {recording['topic']}")
-
-            except Exception as proc_error:
-                logger.error(f"Error processing recording {recording['topic']}: {str(proc_error)}")
-                continue
+                for recording in target_recordings
+            ]
+        for future in futures:
+            future.result()
 
         logger.info("Finished processing all recordings")
 
     except Exception as e:
         logger.error(f"Application error: {str(e)}")
         raise
+    finally:
+        # Let queued Slack notifications finish and release pooled connections,
+        # including on early returns and errors
+        if slack is not None:
+            slack.close()
+        if zoom is not None:
+            zoom.close()
 
 if __name__ == "__main__":
     main()
@@ -3,10 +3,17 @@ Rclone client for managing file uploads to Google Shared Drive.
 Replaces Google Drive API with rclone for more efficient file transfers.
 Uses the 'recordingdrive' remote configured for Google Shared Drive.
 """
+import configparser
 import logging
 import subprocess
 import shutil
 import json
+import threading
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up parsing large lsjson listings
+    orjson = None
 
 from zoom_manager.config import settings
 from zoom_manager.config.settings import RCLONE_REMOTE_NAME, RCLONE_BASE_PATH
@@ -31,6 +38,11 @@ class RcloneClient:
         self.remote_name = remote_name or RCLONE_REMOTE_NAME
         self.base_path = base_path or RCLONE_BASE_PATH or ""
         self.rclone_executable = None
+        self._lsjson_cache = {}
+        # Recordings upload concurrently: each upload bumps its folder's generation so a
+        # listing fetched while the upload was finishing is never cached
+        self._lsjson_generations = {}
+        self._lsjson_lock = threading.Lock()
         self._check_rclone_availability()
 
     def _check_rclone_availability(self):
@@ -54,11 +66,14 @@ class RcloneClient:
                 check=True
             )
 
-            configured_remotes = [line.strip().rstrip(':') for line in result.stdout.strip().split('\n') if line.strip()]
+            # Keep the parsed remotes so later lookups don't re-run listremotes
+            self._remotes = frozenset(
+                line.strip().rstrip(':') for line in result.stdout.splitlines() if line.strip()
+            )
 
-            if self.remote_name not in configured_remotes:
+            if not self.is_remote_configured(self.remote_name):
                 raise RuntimeError(f"rclone remote '{self.remote_name}' is not configured. "
-                                   f"Available remotes: {', '.join(configured_remotes)}")
+                                   f"Available remotes: {', '.join(sorted(self._remotes))}")
 
             self.logger.info(f"rclone is available and remote '{self.remote_name}' is configured")
 
@@ -69,6 +84,20 @@ class RcloneClient:
             self.logger.error(f"Error checking rclone availability: {e}")
             raise
 
+    def is_remote_configured(self, name):
+        """
+        Check whether an rclone remote is configured.
+
+        Args:
+            name (str): Remote name, with or without the trailing ':'
+
+        Returns:
+            bool: True if the remote was listed by 'rclone listremotes'
+        """
+        if not name:
+            return False
+        return name.rstrip(':') in self._remotes
+
     def _create_remote_directory(self, remote_path):
         """
         Create directory structure on the remote if it doesn't exist.
@@ -81,14 +110,14 @@ class RcloneClient:
         """
         try:
             # Use rclone mkdir to create the directory
-            result = subprocess.run(
+            subprocess.run(
                 [self.rclone_executable, "mkdir", remote_path],
                 capture_output=True,
                 text=True,
                 check=True
             )
 
-            self.logger.debug(f"Created/verified remote directory: {remote_path}")
+            self.logger.debug("Created/verified remote directory: %s", remote_path)
             return True
 
         except subprocess.CalledProcessError as e:
@@ -99,10 +128,51 @@ class RcloneClient:
             self.logger.error(f"Failed to create remote directory {remote_path}: {e}")
             return False
 
+    def _transfer_flags(self):
+        """
+        Build the rclone tuning flags used for uploads.
+        Lets a single copy run several file transfers in parallel and upload
+        large files in bigger chunks.
+
+        Returns:
+            list: rclone command line flags
+        """
+        flags = [
+            "--transfers", str(settings.RCLONE_TRANSFERS),
+            "--checkers", str(settings.RCLONE_CHECKERS),
+            "--drive-chunk-size", settings.RCLONE_DRIVE_CHUNK_SIZE,
+            "--use-mmap",
+            "--fast-list",
+        ]
+        if settings.RCLONE_DRIVE_UPLOAD_CUTOFF:
+            flags.extend(["--drive-upload-cutoff", settings.RCLONE_DRIVE_UPLOAD_CUTOFF])
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("rclone transfer flags: %s", " ".join(flags))
+        return flags
+
+    def _output_flags(self):
+        """
+        Build the rclone progress and logging flags for uploads.
+        Live progress stats are only rendered in debug mode; otherwise they are disabled
+        since nobody watches a captured, non-interactive stdout.
+
+        Returns:
+            list: rclone command line flags
+        """
+        if settings.DEBUG:
+            return [
+                "--progress",
+                "--stats-one-line",
+                "--stats=1s",
+                "--verbose",
+                "--log-level", "DEBUG",
+            ]
+        return ["--stats=0"]
+
     def upload_file(self, file_dict):
         """
         Upload file to Google Drive using rclone.
-        Creates the necessary directory structure and uploads the file.
+        The date folder is created on the remote as part of the copy.
 
         Args:
             file_dict (dict): File information containing:
@@ -116,50 +186,49 @@ class RcloneClient:
             str: Success message or file path
 
         Raises:
+            ValueError: If file_dict carries in-memory data instead of a local path
             Exception: If upload fails
         """
+        # Files are always streamed from disk; never buffer recordings in memory
+        if 'data' in file_dict or 'path' not in file_dict:
+            raise ValueError("file_dict must reference a local 'path', not in-memory 'data'")
+
         try:
-            self.logger.debug(f"Uploading file_dict: {file_dict}")
+            self.logger.debug("Uploading file_dict: %s", file_dict)
 
             # Build the remote path following the structure:
             # recordingdrive:"FOLDER/SUBFOLDER/YYYY-MM-DD/"
             date_folder = file_dict['date_folder']
 
-            # Construct the full remote directory path
+            # Construct the full remote directory path; rclone copy creates it if missing
             remote_dir = f"{self.remote_name}:{self.base_path}/{date_folder}"
 
-            # Create the directory structure if it doesn't exist
-            self.logger.info(f"Creating remote directory: {remote_dir}")
-            self._create_remote_directory(remote_dir)
-
             # Prepare the source file path
             source_file = str(file_dict['path'])
 
-            # Construct the destination path (not directly used in copy cmd)
-            destination = f"{self.remote_name}:{self.base_path}/{date_folder}/{file_dict['name']}"
-
             self.logger.info(f"Uploading {file_dict['name']} to {self.base_path}/{date_folder}/")
 
-            # Use rclone copy command with progress output
             rclone_cmd = [
                 self.rclone_executable,
                 "copy",
                 source_file,
                 remote_dir,
-                "--progress",
-                "--stats-one-line",
-                "--stats=1s",
+                # Recordings are never overwritten, so skip the destination listing
+                "--no-traverse",
+                "--ignore-existing",
+                *self._transfer_flags(),
             ]
 
-            # Add debug output if in debug mode
-            if settings.DEBUG:
-                rclone_cmd.extend(["--verbose", "--log-level", "DEBUG"])
+            # Progress and debug output only in debug mode
+            rclone_cmd.extend(self._output_flags())
 
             # Execute the rclone copy command
             subprocess.run(
                 rclone_cmd,
+                stdout=None if settings.DEBUG else subprocess.DEVNULL,
                 check=True
             )
+            self._invalidate_listing(date_folder)
 
             self.logger.info(f"Successfully uploaded {file_dict['name']}")
 
@@ -175,6 +244,65 @@ class RcloneClient:
             self.logger.error(f"Failed to upload file: {str(e)}")
             raise
 
+    def upload_stream(self, chunks, file_dict):
+        """
+        Upload a file to Google Drive by piping its bytes into rclone rcat.
+        Nothing is written to local disk.
+
+        Args:
+            chunks (iterable): Iterator of bytes making up the file
+            file_dict (dict): File information containing:
+                - name: File name
+                - date_folder: Target folder name (e.g., "2024-06-20")
+
+        Returns:
+            str: Relative remote path of the uploaded file
+
+        Raises:
+            subprocess.CalledProcessError: If rclone rcat fails
+            Exception: Any error raised while reading chunks; rclone is killed first
+                so a partial file is never committed to the remote
+        """
+        date_folder = file_dict['date_folder']
+        # rcat has no --ignore-existing; skip files a previous run already uploaded
+        if self.has_file(file_dict['name'], date_folder):
+            self.logger.info(f"File {file_dict['name']} already exists in {date_folder}, skipping")
+            return f"{self.base_path}/{date_folder}/{file_dict['name']}"
+
+        destination = f"{self.remote_name}:{self.base_path}/{date_folder}/{file_dict['name']}"
+
+        cmd = [
+            self.rclone_executable,
+            "rcat",
+            destination,
+            "--drive-chunk-size", settings.RCLONE_DRIVE_CHUNK_SIZE,
+        ]
+        if settings.DEBUG:
+            cmd.extend(["--verbose", "--log-level", "DEBUG"])
+
+        self.logger.info(f"Streaming {file_dict['name']} to {self.base_path}/{date_folder}/")
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        try:
+            for chunk in chunks:
+                process.stdin.write(chunk)
+            process.stdin.close()
+        except BrokenPipeError:
+            # rclone exited before reading everything
+            raise subprocess.CalledProcessError(process.wait() or 1, cmd)
+        except BaseException:
+            # Kill rclone before it sees EOF, otherwise it saves the truncated stream
+            process.kill()
+            process.wait()
+            raise
+
+        returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+        self._invalidate_listing(date_folder)
+        self.logger.info(f"Successfully uploaded {file_dict['name']}")
+        return f"{self.base_path}/{date_folder}/{file_dict['name']}"
+
     def upload_directory(self, local_path, date_folder):
         """
         Upload all files from a local folder to the remote date_folder in one rclone copy.
@@ -186,30 +314,36 @@ class RcloneClient:
         Returns:
             str: Relative remote path where files were uploaded (base_path/date_folder)
         """
+        # rclone copy creates the remote directory if it doesn't exist
         remote_dir = f"{self.remote_name}:{self.base_path}/{date_folder}"
-        self.logger.info(f"Creating/validating remote directory: {remote_dir}")
-        self._create_remote_directory(remote_dir)
 
         cmd = [
             self.rclone_executable,
             "copy",
             str(local_path),
             remote_dir,
-            "--progress",
-            "--stats-one-line",
-            "--stats=1s",
-            "--checksum"  # verify file integrity and skip unchanged
+            # Size-only avoids re-hashing every local file; checksum verifies integrity
+            "--size-only" if settings.RCLONE_FAST_COMPARE else "--checksum",
+            # Never publish downloads left unfinished by an interrupted run
+            "--exclude", "*.part",
+            *self._transfer_flags(),
+            *self._output_flags(),
         ]
-        if settings.DEBUG:
-            cmd.extend(["--verbose", "--log-level", "DEBUG"])
 
         self.logger.info(f"Uploading directory {local_path} to {remote_dir}")
-        subprocess.run(cmd, check=True)
+        subprocess.run(
+            cmd,
+            stdout=None if settings.DEBUG else subprocess.DEVNULL,
+            check=True
+        )
+        self._invalidate_listing(date_folder)
         return f"{self.base_path}/{date_folder}"
 
     def check_file_exists(self, file_name, date_folder):
         """
         Check if file already exists in the specified remote directory.
+        Spawns one rclone process per call, so it is meant for explicit status
+        checks only; uploads rely on rclone's --ignore-existing instead.
 
         Args:
             file_name (str): Name of file to check
@@ -235,7 +369,7 @@ class RcloneClient:
             if exists:
                 self.logger.info(f"File {file_name} already exists in {date_folder}")
             else:
-                self.logger.debug(f"File {file_name} does not exist in {date_folder}")
+                self.logger.debug("File %s does not exist in %s", file_name, date_folder)
 
             return bool(exists)
 
@@ -243,39 +377,107 @@ class RcloneClient:
             self.logger.error(f"Failed to check file existence: {str(e)}")
             return False
 
-    def get_file_id(self, date_folder: str, file_name: str) -> str:
+    def has_file(self, file_name, date_folder):
         """
-        Retrieve the Google Drive file ID for the specified file in the remote directory.
-        Uses rclone lsjson to fetch metadata and extract the file ID.
+        Check whether a file is already in a remote date folder using the cached listing.
+        A folder that cannot be listed (e.g. not created yet) is treated as empty.
+
+        Args:
+            file_name (str): Name of file to check
+            date_folder (str): Date folder name (e.g., "2024-06-20")
+
+        Returns:
+            bool: True if file exists, False otherwise
         """
-        remote_path = f"{self.remote_name}:{self.base_path}/{date_folder}/{file_name}"
+        try:
+            return file_name in self._list_date_folder(date_folder)
+        except RuntimeError as e:
+            self.logger.debug("Could not list %s: %s", date_folder, e)
+            return False
+
+    def _list_date_folder(self, date_folder: str) -> dict:
+        """
+        Return rclone lsjson metadata for a remote date folder, keyed by file name.
+        The listing is fetched once and cached until the next upload to the folder.
+
+        Args:
+            date_folder (str): Date folder name (e.g., "2024-06-20")
+
+        Returns:
+            dict: Mapping of file name to rclone metadata entry
+        """
+        with self._lsjson_lock:
+            listing = self._lsjson_cache.get(date_folder)
+            if listing is not None:
+                return listing
+            generation = self._lsjson_generations.get(date_folder, 0)
+
+        remote_dir = f"{self.remote_name}:{self.base_path}/{date_folder}"
         try:
             result = subprocess.run(
-                [self.rclone_executable, "lsjson", remote_path],
+                # Only names and IDs are needed; skip the modtime and MIME type lookups
+                [self.rclone_executable, "lsjson", "--files-only", "--no-modtime", "--no-mimetype", remote_dir],
                 capture_output=True,
-                text=True,
                 check=True
             )
-            entries = json.loads(result.stdout)
-            if not entries:
-                raise ValueError(f"No metadata found for file '{file_name}' in '{date_folder}'")
-            meta = entries[0]
-
-            file_id = meta.get("ID") or meta.get("Id") or meta.get("id")
-            if not file_id:
-
-                for key, val in meta.items():
-                    if 'id' in key.lower():
-                        file_id = val
-                        break
-            if not file_id:
-                raise ValueError(f"File ID not found in metadata keys: {list(meta.keys())}")
-            return file_id
+            # Parse the raw bytes directly rather than decoding to str first
+            entries = orjson.loads(result.stdout) if orjson else json.loads(result.stdout)
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to retrieve metadata via rclone: {e.stderr or e}")
-        except json.JSONDecodeError as e:
+            stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else e.stderr
+            raise RuntimeError(f"Failed to retrieve metadata via rclone: {stderr or e}")
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             raise RuntimeError(f"Failed to parse rclone metadata JSON: {e}")
 
+        listing = {entry["Name"]: entry for entry in entries}
+        with self._lsjson_lock:
+            # Only cache if no upload to the folder completed while listing it
+            if self._lsjson_generations.get(date_folder, 0) == generation:
+                self._lsjson_cache[date_folder] = listing
+        return listing
+
+    def _invalidate_listing(self, date_folder: str):
+        """
+        Drop the cached listing of a date folder after an upload to it.
+
+        Args:
+            date_folder (str): Date folder name (e.g., "2024-06-20")
+        """
+        with self._lsjson_lock:
+            self._lsjson_cache.pop(date_folder, None)
+            self._lsjson_generations[date_folder] = self._lsjson_generations.get(date_folder, 0) + 1
+
+    def get_file_id(self, date_folder: str, file_name: str) -> str:
+        """
+        Retrieve the Google Drive file ID for the specified file in the remote directory.
+        Looks the file up in the cached lsjson listing of its date folder.
+        """
+        meta = self._list_date_folder(date_folder).get(file_name)
+        if not meta:
+            raise ValueError(f"No metadata found for file '{file_name}' in '{date_folder}'")
+
+        file_id = meta.get("ID") or meta.get("Id") or meta.get("id")
+        if not file_id:
+            raise ValueError(f"File ID not found in metadata keys: {list(meta.keys())}")
+        return file_id
+
+    def get_file_ids(self, date_folder: str) -> dict:
+        """
+        Retrieve Google Drive file IDs for every file in a remote date folder.
+        Uses a single rclone lsjson listing rather than one call per file.
+
+        Args:
+            date_folder (str): Date folder name (e.g., "2024-06-20")
+
+        Returns:
+            dict: Mapping of file name to Google Drive file ID
+        """
+        file_ids = {}
+        for name, entry in self._list_date_folder(date_folder).items():
+            file_id = entry.get("ID") or entry.get("Id") or entry.get("id")
+            if file_id:
+                file_ids[name] = file_id
+        return file_ids
+
     def get_remote_info(self):
         """
         Get information about the configured rclone remote.
@@ -292,13 +494,21 @@ class RcloneClient:
                 check=True
             )
 
-            config_info = {}
-            for line in result.stdout.strip().split('\n'):
-                if '=' in line and not line.startswith('['):
-                    key, value = line.split('=', 1)
-                    config_info[key.strip()] = value.strip()
-
-            return config_info
+            # rclone prints the remote as an INI section; some versions wrap it in separator lines
+            parser = configparser.ConfigParser(interpolation=None, allow_no_value=True, strict=False)
+            parser.optionxform = str  # keep rclone's option names as-is
+            section_start = result.stdout.find('[')
+            if section_start != -1:
+                parser.read_string(result.stdout[section_start:])
+            if not parser.has_section(self.remote_name):
+                self.logger.error(f"Remote '{self.remote_name}' not found in rclone config output")
+                return {}
+
+            return {
+                key: value
+                for key, value in parser.items(self.remote_name)
+                if value is not None
+            }
 
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Failed to get remote info: {e}")
@@ -316,7 +526,7 @@ class RcloneClient:
         """
         try:
             # Try to list the root of the remote
-            result = subprocess.run(
+            subprocess.run(
                 [self.rclone_executable, "lsd", f"{self.remote_name}:"],
                 capture_output=True,
                 text=True,
@@ -1,7 +1,10 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from zoom_manager.config.settings import SLACK_WEBHOOK_URL
 
 
@@ -13,6 +16,17 @@ class SlackClient:
     Uses Slack's incoming webhook functionality for message delivery.
     """
 
+    # Footer block shared by every notification; only the section text varies
+    _CONTEXT_BLOCK = {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "_Brought to you with the power of Copilot, Zed, Warp and Cursor_"
+            }
+        ]
+    }
+
     def __init__(self, webhook_url=None):
         """Initialize SlackClient with logging configuration.
 
@@ -23,6 +37,15 @@ class SlackClient:
         self.logger = logging.getLogger(__name__)
         self.webhook_url = SLACK_WEBHOOK_URL if webhook_url is None else webhook_url
 
+        # Reuse one keep-alive connection to the webhook host across notifications
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.2)),
+        )
+        # Background senders for queue_notification
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack")
+
     def send_notification(self, recording_name: str, file_name: str, file_id: str):
         """
         Send a formatted notification to Slack about an uploaded recording.
@@ -53,19 +76,11 @@ class SlackClient:
                             "text": f"*New recording uploaded*\n• Recording: {recording_name}\n• File: {file_name}\n• {self._format_drive_reference(file_id)}"
                         }
                     },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": "_Brought to you with the power of Copilot, Zed, Warp and Cursor_"
-                            }
-                        ]
-                    }
+                    self._CONTEXT_BLOCK
                 ]
             }
 
-            response = requests.post(self.webhook_url, json=message, timeout=REQUEST_TIMEOUT)
+            response = self._session.post(self.webhook_url, json=message, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             self.logger.info(f"Slack notification sent for {file_name}")
 
@@ -84,6 +99,30 @@ class SlackClient:
         except Exception as e:
             self.logger.error("Failed to send Slack notification: %s", e.__class__.__name__)
 
+    def queue_notification(self, recording_name: str, file_name: str, file_id: str):
+        """
+        Send a notification in the background so the caller doesn't wait on Slack.
+
+        Args:
+            recording_name (str): Name of the recording/meeting
+            file_name (str): Name of the uploaded file
+            file_id (str): Google Drive file ID for direct link
+
+        Returns:
+            concurrent.futures.Future: Completes once the notification has been handled
+        """
+        return self._executor.submit(
+            self.send_notification,
+            recording_name=recording_name,
+            file_name=file_name,
+            file_id=file_id,
+        )
+
+    def close(self):
+        """Wait for queued notifications to finish and release the HTTP session."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
     def _format_drive_reference(self, file_id: str) -> str:
         """Format a Google Drive file ID or fallback path for Slack."""
         if not file_id:
@@ -1,12 +1,21 @@
 import logging
 import json
+import os
 import re
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from http.cookiejar import DefaultCookiePolicy
+from pathlib import Path
 from urllib.parse import quote
 
 import pytz
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 from zoom_manager.config.settings import (
     ZOOM_API_BASE_URL,
@@ -20,6 +29,14 @@ from zoom_manager.config import settings
 
 REQUEST_TIMEOUT = (10, 60)
 DOWNLOAD_TIMEOUT = (10, 300)
+# Files at least this large are fetched over several ranged connections
+RANGED_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+# Bytes read from the socket and written to disk per iteration
+DOWNLOAD_BLOCK_SIZE = 8 * 1024 * 1024
+# Minimum seconds between progress bar redraws; updates in between only bump the counter
+PROGRESS_REFRESH_INTERVAL = 0.25
+# Appended to a download's file name until it has been fully received
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
 INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 
 class ZoomClient:
@@ -43,12 +60,45 @@ class ZoomClient:
         self.logger = logging.getLogger(__name__)
         self.access_token = None
         self.token_expires_at = None
-        
+        # Files are downloaded from several threads; only one of them refreshes the token
+        self._token_lock = threading.Lock()
+        # Keep-alive connections to Zoom shared by API calls and downloads from every
+        # worker thread. The session is only used for stateless requests: headers and
+        # auth are passed per call and cookies are never stored, so threads share nothing
+        # but urllib3's thread-safe connection pool. That pool is sized for the most
+        # requests in flight (recordings x files x ranges per file) so none of them
+        # has to open a connection the pool would then discard
+        pool_size = max(
+            16,
+            settings.MAX_CONCURRENT_RECORDINGS
+            * settings.MAX_CONCURRENT_DOWNLOADS
+            * settings.DOWNLOAD_CONNECTIONS,
+        )
+        self._session = requests.Session()
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=pool_size,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            ),
+        )
+        # Headers are rebuilt only when the token changes
+        self._headers = None
+        self._headers_token = None
+        self._load_cached_token()
+
     def _get_access_token(self):
         """
         Retrieve or refresh OAuth 2.0 access token for Zoom API authentication.
         Returns cached token if valid, otherwise requests new token.
         """
+        with self._token_lock:
+            return self._refresh_access_token()
+
+    def _refresh_access_token(self):
+        """Return the cached token if still valid, otherwise request a new one."""
         if self.access_token and datetime.now() < self.token_expires_at:
             return self.access_token
 
@@ -60,12 +110,13 @@ class ZoomClient:
         }
 
         try:
-            response = requests.post(url, auth=auth, data=data, timeout=REQUEST_TIMEOUT)
+            response = self._session.post(url, auth=auth, data=data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             token_info = response.json()
             
             self.access_token = token_info["access_token"]
             self.token_expires_at = datetime.now() + timedelta(seconds=token_info["expires_in"] - 300)
+            self._save_cached_token()
             
             return self.access_token
         except requests.RequestException as e:
@@ -74,15 +125,121 @@ class ZoomClient:
                 self.logger.error(f"Response content: {e.response.text}")
             raise
 
+    def close(self):
+        """Close the pooled HTTP session and its keep-alive connections."""
+        self._session.close()
+
+    def _token_cache_key(self):
+        """Identify the Zoom app a cached token belongs to, without storing the secret."""
+        return f"{ZOOM_ACCOUNT_ID}:{ZOOM_CLIENT_ID}"
+
+    def _load_cached_token(self):
+        """
+        Reuse an unexpired access token saved by a previous run.
+        A missing, unreadable or mismatched cache file is ignored.
+        """
+        if not settings.ZOOM_TOKEN_CACHE_FILE:
+            return
+
+        try:
+            with open(settings.ZOOM_TOKEN_CACHE_FILE) as cache_file:
+                cached = json.load(cache_file)
+            if cached["key"] != self._token_cache_key():
+                return
+            expires_at = datetime.fromtimestamp(cached["expires_at"])
+            access_token = cached["access_token"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        if datetime.now() < expires_at:
+            self.access_token = access_token
+            self.token_expires_at = expires_at
+            self.logger.debug("Using cached Zoom access token")
+
+    def _save_cached_token(self):
+        """
+        Persist the current access token so the next run can skip the OAuth request.
+        The file is only readable by the current user and replaced atomically.
+        """
+        if not settings.ZOOM_TOKEN_CACHE_FILE:
+            return
+
+        cache_path = Path(settings.ZOOM_TOKEN_CACHE_FILE)
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".token-")
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump({
+                    "key": self._token_cache_key(),
+                    "access_token": self.access_token,
+                    "expires_at": self.token_expires_at.timestamp(),
+                }, cache_file)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache Zoom access token: {str(e)}")
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def _invalidate_token(self, rejected_headers):
+        """
+        Forget an access token Zoom has rejected, including its cached copy on disk.
+        Does nothing if another thread already replaced the token.
+
+        Args:
+            rejected_headers (dict): Headers returned by _get_headers for the rejected request
+        """
+        with self._token_lock:
+            if rejected_headers is not self._headers:
+                return
+            self.access_token = None
+            self.token_expires_at = None
+            self._headers = None
+            self._headers_token = None
+            if settings.ZOOM_TOKEN_CACHE_FILE:
+                try:
+                    Path(settings.ZOOM_TOKEN_CACHE_FILE).unlink(missing_ok=True)
+                except OSError as e:
+                    self.logger.warning(f"Could not remove cached Zoom access token: {str(e)}")
+
+    def _authorized_get(self, url, **kwargs):
+        """
+        Send an authorized GET request, retrying once with a new token on HTTP 401.
+        A token cached from a previous run may have been revoked or belong to rotated
+        app credentials, so a rejection triggers a fresh OAuth request.
+
+        Args:
+            url (str): Request URL
+            **kwargs: Extra arguments for requests.Session.get
+
+        Returns:
+            requests.Response: Response to the request, or to the retry
+        """
+        headers = self._get_headers()
+        response = self._session.get(url, headers=headers, **kwargs)
+        if response.status_code != 401:
+            return response
+
+        self.logger.warning("Zoom rejected the access token, requesting a new one")
+        response.close()
+        self._invalidate_token(headers)
+        return self._session.get(url, headers=self._get_headers(), **kwargs)
+
     def _get_headers(self):
         """
         Construct HTTP headers with current access token for API requests.
-        Returns dict with Authorization and Content-Type headers.
+        Returns dict with Authorization and Content-Type headers; the same dict is
+        reused until the token changes, so callers must copy it before modifying.
         """
-        return {
-            "Authorization": f"Bearer {self._get_access_token()}",
-            "Content-Type": "application/json"
-        }
+        token = self._get_access_token()
+        if token != self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            }
+            self._headers_token = token
+        return self._headers
 
     def _convert_to_melbourne_time(self, utc_time_str):
         """
@@ -99,9 +256,8 @@ class ZoomClient:
         # Ensure UTC tzinfo if none
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=pytz.UTC)
-        # Convert to Melbourne timezone
-        mel_tz = pytz.timezone('Australia/Melbourne')
-        return dt.astimezone(mel_tz)
+        # Convert to Melbourne timezone (resolved once in settings)
+        return dt.astimezone(settings.TIMEZONE)
 
     def get_user_by_email(self, email: str):
         """
@@ -119,11 +275,7 @@ class ZoomClient:
             encoded_email = quote(email, safe="")
             url = f"{ZOOM_API_BASE_URL}/users/{encoded_email}"
             
-            response = requests.get(
-                url, 
-                headers=self._get_headers(),
-                timeout=REQUEST_TIMEOUT,
-            )
+            response = self._authorized_get(url, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 404:
                 raise ValueError(f"User with email {email} not found")
@@ -166,7 +318,7 @@ class ZoomClient:
 
         try:
             self.logger.info(f"Fetching recordings for user ID: {user_id}")
-            self.logger.debug(f"Date range: {start_date} to {end_date}")
+            self.logger.debug("Date range: %s to %s", start_date, end_date)
             
             all_meetings = []
             recordings = {}
@@ -178,12 +330,7 @@ class ZoomClient:
                 else:
                     params.pop("next_page_token", None)
 
-                response = requests.get(
-                    url,
-                    headers=self._get_headers(),
-                    params=params,
-                    timeout=REQUEST_TIMEOUT,
-                )
+                response = self._authorized_get(url, params=params, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 recordings = response.json()
                 all_meetings.extend(recordings.get('meetings', []))
@@ -218,39 +365,75 @@ class ZoomClient:
             download_url (str): URL to download the recording
             output_path (Path): Destination path for downloaded file
         Returns:
-            bool: True if download successful, False if skipped in DEBUG mode
+            int: Number of bytes written, or None if skipped in DEBUG mode
         Raises:
             RuntimeError: If download is incomplete
             RequestException: If download request fails
         """
         if settings.DEBUG:
             self.logger.info(f"[DEBUG] Would download from {download_url} to {output_path}")
-            return False  # Indicate that download was skipped
+            return None  # Indicate that download was skipped
+
+        # Write to a private .part file next to the target and rename it into place once
+        # complete, so an interrupted run never leaves a truncated file under the final name
+        fd, part_name = tempfile.mkstemp(
+            dir=output_path.parent, prefix=f"{output_path.name}.", suffix=PARTIAL_DOWNLOAD_SUFFIX
+        )
+        os.close(fd)
+        part_path = Path(part_name)
 
         try:
-            response = requests.get(
-                download_url,
-                headers=self._get_headers(),
-                stream=True,
-                timeout=DOWNLOAD_TIMEOUT,
-            )
+            response = self._authorized_get(download_url, stream=True, timeout=DOWNLOAD_TIMEOUT)
             response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 1024 * 1024  # 1 Mebibyte
-
-            with tqdm(total=total_size, unit='iB', unit_scale=True, desc=f"Downloading {output_path.name}") as progress_bar:
-                with open(output_path, 'wb') as file:
-                    for data in response.iter_content(block_size):
-                        if not data:
-                            continue
-                        progress_bar.update(len(data))
-                        file.write(data)
+            headers = self._get_headers()  # Reused for range requests and retries
 
-            if total_size != 0 and progress_bar.n != total_size:
+            total_size = int(response.headers.get('content-length', 0))
+            written = 0
+
+            with tqdm(
+                total=total_size,
+                unit='iB',
+                unit_scale=True,
+                desc=f"Downloading {output_path.name}",
+                mininterval=PROGRESS_REFRESH_INTERVAL,
+            ) as progress_bar:
+                ranged = self._supports_ranged_download(response, total_size)
+                if ranged:
+                    # Large file on a server that honours Range: fetch it over several connections
+                    response.close()
+                    try:
+                        self._download_ranges(download_url, headers, part_path, total_size, progress_bar)
+                        written = total_size  # Each range is checked for completeness
+                    except Exception as e:
+                        # e.g. a CDN hop that ignores Range; start over on a single connection
+                        self.logger.warning(
+                            f"Ranged download of {output_path.name} failed ({str(e)}), retrying as a single stream"
+                        )
+                        progress_bar.reset(total=total_size)
+                        response = self._session.get(
+                            download_url,
+                            headers=headers,
+                            stream=True,
+                            timeout=DOWNLOAD_TIMEOUT,
+                        )
+                        response.raise_for_status()
+                        ranged = False
+
+                if not ranged:
+                    # Opening with 'wb' also truncates anything a failed ranged attempt wrote
+                    with open(part_path, 'wb') as file:
+                        for data in response.iter_content(DOWNLOAD_BLOCK_SIZE):
+                            if not data:
+                                continue
+                            progress_bar.update(len(data))
+                            file.write(data)
+                            written += len(data)
+
+            if total_size != 0 and written != total_size:
                 raise RuntimeError("Download incomplete")
-                
-            return True
+
+            os.replace(part_path, output_path)
+            return written
             
         except requests.RequestException as e:
             error_message = str(e)
@@ -261,47 +444,115 @@ class ZoomClient:
                 except json.JSONDecodeError:
                     pass
             self.logger.error(f"Failed to download recording: {error_message}")
-            if output_path.exists():
-                output_path.unlink()
+            part_path.unlink(missing_ok=True)
             raise
         except Exception as e:
             self.logger.error(f"Error during download: {str(e)}")
-            if output_path.exists():
-                output_path.unlink()
+            part_path.unlink(missing_ok=True)
             raise
 
-    def process_recording(self, recording_info, meeting_name):
+    def _supports_ranged_download(self, response, total_size):
         """
-        Process and download all files associated with a recording.
-        Handles multiple recording types (video, transcript, chat) and manages file organization.
-        
+        Check whether a download should be split into parallel HTTP Range requests.
+        Requires a large, unencoded body from a server that advertises byte ranges.
+        """
+        return (
+            settings.DOWNLOAD_CONNECTIONS > 1
+            and total_size >= RANGED_DOWNLOAD_MIN_SIZE
+            and response.headers.get('accept-ranges', '').lower() == 'bytes'
+            and 'content-encoding' not in response.headers
+            and hasattr(os, 'pwrite')
+        )
+
+    def _download_ranges(self, download_url, headers, output_path, total_size, progress_bar):
+        """
+        Download a file as several byte ranges in parallel, writing each at its own offset.
+        Args:
+            download_url (str): URL to download the recording
+            headers (dict): Request headers including authorization
+            output_path (Path): Destination path for downloaded file
+            total_size (int): Size of the file in bytes
+            progress_bar (tqdm): Progress bar updated as bytes arrive
+        Raises:
+            RuntimeError: If the server ignores a range request or a range is incomplete
+            RequestException: If a range request fails
+        """
+        part_size = -(-total_size // settings.DOWNLOAD_CONNECTIONS)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        failed = threading.Event()
+
+        with open(output_path, 'wb') as file:
+            file.truncate(total_size)
+            fd = file.fileno()
+
+            def fetch_range(start, end):
+                range_headers = {**headers, "Range": f"bytes={start}-{end}"}
+                with self._session.get(
+                    download_url,
+                    headers=range_headers,
+                    stream=True,
+                    timeout=DOWNLOAD_TIMEOUT,
+                ) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise RuntimeError("Server ignored range request")
+
+                    offset = start
+                    for data in response.iter_content(DOWNLOAD_BLOCK_SIZE):
+                        if failed.is_set():
+                            return  # Another range failed; the whole download is discarded
+                        if not data:
+                            continue
+                        os.pwrite(fd, data, offset)
+                        offset += len(data)
+                        progress_bar.update(len(data))
+
+                if offset != end + 1:
+                    raise RuntimeError("Download incomplete")
+
+            def fetch_range_or_abort(start, end):
+                try:
+                    fetch_range(start, end)
+                except BaseException:
+                    failed.set()
+                    raise
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch_range_or_abort, start, end) for start, end in ranges]
+                for future in futures:
+                    future.result()
+
+    def _plan_recording_files(self, recording_info, meeting_name):
+        """
+        Work out the target name and download URL of every downloadable file in a recording.
+        Skips files Zoom is still processing and file types without a known extension.
+
         Args:
             recording_info (dict): Recording metadata from Zoom API
             meeting_name (str): Name of the meeting for file naming
         Returns:
-            list: Information about downloaded files including paths and metadata
+            list: File information dicts with name, download_url, date_folder and recording_time
         """
         melbourne_time = self._convert_to_melbourne_time(recording_info['start_time'])
         safe_meeting_name = self._sanitize_filename_part(meeting_name, "recording")
         base_folder_name = melbourne_time.strftime("%d %B %Y - ") + safe_meeting_name
         date_folder = melbourne_time.strftime("%Y-%m-%d")  # Ensure correct date format
 
-        folder_path = DOWNLOAD_DIR / date_folder
-        folder_path.mkdir(parents=True, exist_ok=True)
-        downloaded_files = []
+        planned_files = []
+        used_names = set()
         recording_files = recording_info.get('recording_files', [])
         
-        # Debug: Log the recording files structure
-        if settings.DEBUG:
-            self.logger.debug(f"Recording files structure: {json.dumps(recording_files, indent=2)}")
+        # Debug: Log the recording files structure, serializing it only if it will be emitted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Recording files structure: %s", json.dumps(recording_files, indent=2))
 
         # Group recordings by type
-        recordings_by_type = {}
+        recordings_by_type = defaultdict(list)
         for file_info in recording_files:
-            file_type = file_info.get('recording_type', '').lower()
-            if file_type not in recordings_by_type:
-                recordings_by_type[file_type] = []
-            recordings_by_type[file_type].append(file_info)
+            recordings_by_type[file_info.get('recording_type', '').lower()].append(file_info)
 
         # Check for recordings still being processed
         processing_files = [f for f in recording_files if f.get('status') == 'processing']
@@ -309,11 +560,11 @@ class ZoomClient:
             self.logger.warning(f"Found {len(processing_files)} files still being processed by Zoom. These will be skipped.")
             self.logger.info("Tip: Wait a few minutes for processing to complete, then try again.")
         
-        for file_type in recordings_by_type:
+        for file_type, group in recordings_by_type.items():
             extension = self._get_file_extension(file_type)
             if not extension:
                 if file_type == '':  # Empty file type usually means processing
-                    processing_count = len([f for f in recordings_by_type[file_type] if f.get('status') == 'processing'])
+                    processing_count = sum(1 for f in group if f.get('status') == 'processing')
                     if processing_count > 0:
                         self.logger.warning(f"Skipping {processing_count} files that are still being processed")
                     else:
@@ -322,33 +573,151 @@ class ZoomClient:
                     self.logger.warning(f"Unknown file type: {file_type}")
                 continue
 
-            for index, file_info in enumerate(recordings_by_type[file_type]):
+            multipart = len(group) > 1
+            for index, file_info in enumerate(group):
                 download_url = file_info.get('download_url')
                 if not download_url:
                     self.logger.warning(f"Skipping {file_type or 'unknown'} file without a download URL")
                     continue
 
-                part_suffix = f"_{index + 1}" if len(recordings_by_type[file_type]) > 1 else ""
+                part_suffix = f"_{index + 1}" if multipart else ""
                 file_name = f"{base_folder_name}{part_suffix}{extension}"
-                output_path = folder_path / file_name
-
-                if self.download_recording(download_url, output_path):
-                    downloaded_files.append({
-                        'name': file_name,
-                        'path': output_path,
-                        'date_folder': date_folder,  # Assign the correct date_folder
-                        'recording_time': recording_info['start_time'],
-                        'file_size': output_path.stat().st_size
-                    })
+                # Several types share an extension (e.g. speaker view with and without
+                # captions); files are downloaded in parallel, so each needs its own name
+                duplicate = 1
+                while file_name in used_names:
+                    duplicate += 1
+                    file_name = f"{base_folder_name}{part_suffix} ({duplicate}){extension}"
+                used_names.add(file_name)
+
+                planned_files.append({
+                    'name': file_name,
+                    'download_url': download_url,
+                    'date_folder': date_folder,  # Assign the correct date_folder
+                    'recording_time': recording_info['start_time'],
+                })
+
+        return planned_files
+
+    def process_recording(self, recording_info, meeting_name, failed_files=None):
+        """
+        Process and download all files associated with a recording.
+        Handles multiple recording types (video, transcript, chat) and manages file organization.
+        
+        Args:
+            recording_info (dict): Recording metadata from Zoom API
+            meeting_name (str): Name of the meeting for file naming
+            failed_files (list, optional): Receives the names of files that failed to
+                download, in plan order
+        Returns:
+            list: Information about downloaded files including paths and metadata.
+                Files that fail to download are logged and left out.
+        """
+        planned_files = self._plan_recording_files(recording_info, meeting_name)
+        if not planned_files:
+            return []
+
+        # Stage each recording in its own folder so recordings from the same day
+        # can be processed concurrently without sharing files
+        recording_key = self._sanitize_filename_part(
+            str(recording_info.get('uuid') or recording_info.get('id') or ''), "recording"
+        )
+        folder_path = DOWNLOAD_DIR / f"{planned_files[0]['date_folder']}_{recording_key}"
+        folder_path.mkdir(parents=True, exist_ok=True)
+        failed = set()
+
+        def download(planned):
+            file_name = planned['name']
+            output_path = folder_path / file_name
+
+            try:
+                file_size = self.download_recording(planned['download_url'], output_path)
+            except Exception as e:
+                # Keep the recording's other files; this one is retried on the next run
+                self.logger.error(f"Skipping {file_name} after failed download: {str(e)}")
+                failed.add(file_name)
+                return None
+            if file_size is None:
+                return None
+            return {
+                'name': file_name,
+                'path': output_path,
+                'date_folder': planned['date_folder'],
+                'recording_time': planned['recording_time'],
+                'file_size': file_size
+            }
+
+        # Download the recording's files (video, audio, transcript, chat) in parallel
+        workers = max(1, min(settings.MAX_CONCURRENT_DOWNLOADS, len(planned_files)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download") as pool:
+            downloaded_files = [f for f in pool.map(download, planned_files) if f]
+
+        if failed_files is not None:
+            failed_files.extend(p['name'] for p in planned_files if p['name'] in failed)
 
         if settings.DEBUG and downloaded_files:
             self.logger.debug("Available items to download:")
             for file in downloaded_files:
-                self.logger.debug(f"- {file['name']} at {file['path']}")
+                self.logger.debug("- %s at %s", file['name'], file['path'])
 
 
         return downloaded_files
 
+    def stream_recording(self, recording_info, meeting_name, upload, exists=None):
+        """
+        Stream all files of a recording straight into an uploader without saving them locally.
+
+        Args:
+            recording_info (dict): Recording metadata from Zoom API
+            meeting_name (str): Name of the meeting for file naming
+            upload (callable): Called as upload(chunks, file_dict) for each file, where
+                chunks is an iterator of bytes and file_dict holds name and date_folder
+            exists (callable, optional): Called as exists(name, date_folder); files it
+                reports as already uploaded are skipped without being downloaded
+        Returns:
+            list: Information about streamed files (name, date_folder, recording_time)
+        Raises:
+            RuntimeError: If a download is incomplete
+            RequestException: If a download request fails
+        """
+        streamed_files = []
+
+        for planned in self._plan_recording_files(recording_info, meeting_name):
+            download_url = planned.pop('download_url')
+            if settings.DEBUG:
+                self.logger.info(f"[DEBUG] Would stream {planned['name']} from {download_url}")
+                continue
+
+            if exists and exists(planned['name'], planned['date_folder']):
+                self.logger.info(f"Skipping {planned['name']}, already uploaded to {planned['date_folder']}")
+                streamed_files.append(planned)
+                continue
+
+            with self._authorized_get(download_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('content-length', 0))
+                upload(self._iter_download(response, total_size), planned)
+
+            streamed_files.append(planned)
+
+        return streamed_files
+
+    def _iter_download(self, response, total_size):
+        """
+        Yield the body of a streaming download response in DOWNLOAD_BLOCK_SIZE chunks.
+        Raises RuntimeError after the last chunk if fewer bytes arrived than announced,
+        so consumers never treat a truncated download as complete.
+        """
+        received = 0
+        for data in response.iter_content(DOWNLOAD_BLOCK_SIZE):
+            if not data:
+                continue
+            received += len(data)
+            yield data
+
+        if total_size != 0 and received != total_size:
+            raise RuntimeError("Download incomplete")
+
     def get_actual_duration(self, recording_info: dict) -> float:
         """
         Calculate actual meeting duration in minutes from start_time and recording end timestamps.